@@ -1,26 +1,49 @@
 """GDC HTTP Upload - Simple file uploader to Genomic Data Commons."""
 
-from .upload import (
-    upload_file_with_progress, 
-    main,
-    SimpleProgress,
-    detect_environment,
-    get_progress_handler
-)
-from .validate import validate_manifest, validate_token, find_manifest_entry
-from .utils import find_file, chunk_reader, format_size
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
     "upload_file_with_progress",
+    "upload_file_multipart",
     "main",
     "SimpleProgress",
-    "detect_environment", 
+    "detect_environment",
     "get_progress_handler",
-    "validate_manifest", 
+    "validate_manifest",
     "validate_token",
     "find_manifest_entry",
     "find_file",
     "chunk_reader",
     "format_size",
-]
\ No newline at end of file
+]
+
+# Public names are resolved on first access so that importing a lightweight
+# submodule (e.g. gdc_uploader.validate) does not pull in click/requests/tqdm.
+_LAZY = {
+    "upload_file_with_progress": ".upload",
+    "upload_file_multipart": ".upload",
+    "main": ".upload",
+    "SimpleProgress": ".upload",
+    "detect_environment": ".upload",
+    "get_progress_handler": ".upload",
+    "validate_manifest": ".validate",
+    "validate_token": ".validate",
+    "find_manifest_entry": ".validate",
+    "find_file": ".utils",
+    "chunk_reader": ".utils",
+    "format_size": ".utils",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,18 +4,27 @@ GDC HTTP Upload - File uploader with environment-aware progress monitoring.
 """
 
 import json
+import math
 import os
+import re
+import socket
 import sys
 import time
+import threading
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from xml.etree import ElementTree
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
 from .validate import validate_manifest, validate_token, find_manifest_entry
-from .utils import find_file
+from .utils import find_file, chunk_reader
 
 try:
     from tqdm import tqdm
@@ -23,23 +32,87 @@ except ImportError:
     tqdm = None
 
 
+_LOG_RULE = '=' * 60
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 1.0  # seconds
+
+_MB = 1024 * 1024
+_GB = 1024 ** 3
+
+# Files above this size get finer-grained progress reports
+_LARGE_FILE_SIZE = 20 * _GB
+
+_GDC_SUBMISSION_URL = "https://api.gdc.cancer.gov/v0/submission"
+
+# Bounds for the adaptive upload chunk size
+_MIN_CHUNK_SIZE = 1024 * 1024
+_MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
+# The multipart API is S3-compatible: every part but the last must be >= 5 MiB
+# and an upload may have at most 10,000 parts
+_MIN_PART_SIZE = 5 * 1024 * 1024
+_MAX_PARTS = 10000
+
+# Most parts uploaded at once; the session's connection pool is sized to match
+_MAX_CONCURRENCY = 8
+
+# Percentage at the end of a curl -# progress line, e.g. "#####    7.5%"
+_CURL_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+
+# (connect, read) timeout for GDC API calls. The read timeout is unbounded
+# because the server only answers an upload once it has received every byte.
+_HTTP_TIMEOUT = (60, None)
+
+# How long the upload waits for the background existence check
+_PRECHECK_TIMEOUT = 2
+
+# (connect, read) timeout for the existence check's HEAD/GET, so a stalled
+# check cannot outlive the upload by much
+_CHECK_HTTP_TIMEOUT = (10, 30)
+
+
+class _UploadAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive on top of urllib3's defaults.
+
+    urllib3 already sets TCP_NODELAY. SO_SNDBUF is deliberately left alone:
+    setting it disables the kernel's send buffer autotuning, which grows the
+    window further than a fixed value would on high-latency links.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Shared session so the existence check and the upload reuse one keep-alive
+# TCP/TLS connection instead of handshaking per request. The pool holds one
+# connection per multipart worker plus one for the existence check.
+_SESSION = requests.Session()
+_SESSION.mount('https://', _UploadAdapter(pool_connections=1, pool_maxsize=_MAX_CONCURRENCY + 1))
+
+
 class Logger:
     """Handles output to both console and optional log file."""
     
     def __init__(self, log_file=None, append=False):
         self.log_file = log_file
         self.file_handle = None
+        self._ts_sec = None
+        self._ts_str = ''
         if log_file:
             mode = 'a' if append else 'w'
-            self.file_handle = open(log_file, mode, encoding='utf-8')
+            self.file_handle = open(log_file, mode, buffering=_LOG_BUFFER_SIZE, encoding='utf-8')
+            self._last_flush = time.monotonic()
             self._write_header()
     
     def _write_header(self):
         """Write header with timestamp to log file."""
         if self.file_handle:
-            self.file_handle.write(f"\n{'='*60}\n")
-            self.file_handle.write(f"GDC Upload Log - {datetime.now().isoformat()}\n")
-            self.file_handle.write(f"{'='*60}\n\n")
+            self.file_handle.write(
+                f"\n{_LOG_RULE}\nGDC Upload Log - {datetime.now().isoformat()}\n{_LOG_RULE}\n\n"
+            )
             self.file_handle.flush()
     
     def echo(self, message, err=False, to_console=True):
@@ -48,12 +121,34 @@ class Logger:
             click.echo(message, err=err)
         
         if self.file_handle:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = self._timestamp()
             if err:
                 self.file_handle.write(f"[{timestamp}] ERROR: {message}\n")
             else:
                 self.file_handle.write(f"[{timestamp}] {message}\n")
+            # Errors go to disk immediately; everything else at most once a
+            # second so progress ticks don't each cost a write syscall.
+            now = time.monotonic()
+            if err or now - self._last_flush >= _LOG_FLUSH_INTERVAL:
+                self.file_handle.flush()
+                self._last_flush = now
+    
+    def flush(self):
+        """Flush buffered log lines to disk."""
+        if self.file_handle:
             self.file_handle.flush()
+            self._last_flush = time.monotonic()
+    
+    def _timestamp(self):
+        """Return the timestamp prefix for log file lines.
+
+        The formatted string only changes once a second, so it is cached.
+        """
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._ts_sec = now
+        return self._ts_str
     
     def write_json(self, data, label="Response"):
         """Write JSON data with proper formatting."""
@@ -63,9 +158,9 @@ class Logger:
     def close(self):
         """Close the log file."""
         if self.file_handle:
-            self.file_handle.write(f"\n{'='*60}\n")
-            self.file_handle.write(f"Log ended at {datetime.now().isoformat()}\n")
-            self.file_handle.write(f"{'='*60}\n")
+            self.file_handle.write(
+                f"\n{_LOG_RULE}\nLog ended at {datetime.now().isoformat()}\n{_LOG_RULE}\n"
+            )
             self.file_handle.close()
     
     def __enter__(self):
@@ -75,6 +170,13 @@ class Logger:
         self.close()
 
 
+def _print_flush(message):
+    """Print a progress line and flush so it shows up in captured logs."""
+    stdout = sys.stdout
+    stdout.write(message + '\n')
+    stdout.flush()
+
+
 class SimpleProgress:
     """Simple progress reporter for non-interactive environments."""
     
@@ -87,58 +189,50 @@ class SimpleProgress:
         self.last_update_time = self.start_time
         self.last_update_bytes = 0
         self.logger = logger
+        self._emit = logger.echo if logger else _print_flush
+        self._total_gb = total / _GB
+        
+        # For files > 20GB, update every 0.25%, otherwise every 1.25%
+        self._update_interval = 0.25 if total > _LARGE_FILE_SIZE else 1.25
+        
+        # Report thresholds in bytes so update() is a single integer compare
+        # between reports. last_percent starts at -1, so the first report is
+        # due at (update_interval - 1)%.
+        self._step_bytes = max(1, math.ceil(total * self._update_interval / 100))
+        self._next_update_bytes = math.ceil(total * (self._update_interval - 1) / 100)
         
     def update(self, n):
         self.current += n
+        if self.current < self._next_update_bytes:
+            return
+        
         percent = 100 * self.current / self.total
+        current_time = time.time()
         
-        # For files > 20GB, update every 0.25%, otherwise every 1.25%
-        twenty_gb = 20 * 1024 * 1024 * 1024
-        update_interval = 0.25 if self.total > twenty_gb else 1.25
+        # Calculate average speed since start
+        elapsed = current_time - self.start_time
+        avg_speed_mbps = (self.current / _MB) / elapsed if elapsed > 0 else 0
         
-        if percent >= self.last_percent + update_interval:
-            current_time = time.time()
-            
-            # Calculate average speed since start
-            elapsed = current_time - self.start_time
-            avg_speed_mbps = (self.current / (1024 * 1024)) / elapsed if elapsed > 0 else 0
-            
-            # Format sizes in GB
-            current_gb = self.current / (1024**3)
-            total_gb = self.total / (1024**3)
-            
-            message = f"{self.desc}: {percent:.2f}% ({current_gb:.2f}/{total_gb:.2f} GB) - {avg_speed_mbps:.2f} MB/s"
-            if self.logger:
-                self.logger.echo(message, to_console=True)
-            else:
-                print(message)
-                sys.stdout.flush()
-            
-            self.last_percent = percent
-            self.last_update_time = current_time
-            self.last_update_bytes = self.current
+        message = f"{self.desc}: {percent:.2f}% ({self.current / _GB:.2f}/{self._total_gb:.2f} GB) - {avg_speed_mbps:.2f} MB/s"
+        self._emit(message)
+        
+        self.last_percent = percent
+        self.last_update_time = current_time
+        self.last_update_bytes = self.current
+        self._next_update_bytes = self.current + self._step_bytes
     
     def __enter__(self):
-        total_gb = self.total / (1024**3)
-        message = f"{self.desc}: 0.00% (0.00/{total_gb:.2f} GB)"
-        if self.logger:
-            self.logger.echo(message, to_console=True)
-        else:
-            print(message)
-            sys.stdout.flush()
+        message = f"{self.desc}: 0.00% (0.00/{self._total_gb:.2f} GB)"
+        self._emit(message)
         return self
     
     def __exit__(self, *args):
         if self.last_percent < 100:
-            total_gb = self.total / (1024**3)
+            total_gb = self._total_gb
             elapsed = time.time() - self.start_time
-            avg_speed_mbps = (self.total / (1024 * 1024)) / elapsed if elapsed > 0 else 0
+            avg_speed_mbps = (self.total / _MB) / elapsed if elapsed > 0 else 0
             message = f"{self.desc}: 100.00% ({total_gb:.2f}/{total_gb:.2f} GB) - {avg_speed_mbps:.2f} MB/s"
-            if self.logger:
-                self.logger.echo(message, to_console=True)
-            else:
-                print(message)
-                sys.stdout.flush()
+            self._emit(message)
 
 
 def detect_environment():
@@ -177,22 +271,27 @@ def get_progress_handler(total_size, desc="Uploading", mode='auto', logger=None)
         )
 
 
-def check_file_exists(url, token, logger=None):
-    """Check if file already exists in GDC."""
-    headers = {
-        'x-auth-token': token
-    }
+def check_file_exists(url, token, logger=None, headers=None):
+    """Check if file already exists in GDC.
+
+    Callers that already built the request headers can pass them as
+    ``headers`` to reuse them.
+    """
+    if headers is None:
+        headers = {
+            'x-auth-token': token
+        }
     
     try:
         # Try HEAD request first (more efficient)
-        response = requests.head(url, headers=headers)
+        response = _SESSION.head(url, headers=headers, timeout=_CHECK_HTTP_TIMEOUT)
         if response.status_code == 200:
             return True, "File already exists in GDC"
         elif response.status_code == 404:
             return False, "File not found"
         else:
             # Try GET for more info
-            response = requests.get(url, headers=headers)
+            response = _SESSION.get(url, headers=headers, timeout=_CHECK_HTTP_TIMEOUT)
             if response.status_code == 200:
                 return True, "File already exists in GDC"
             else:
@@ -203,41 +302,138 @@ def check_file_exists(url, token, logger=None):
         return None, str(e)
 
 
-def upload_file_with_progress(file_path, file_id, token, chunk_size=8*1024*1024, progress_mode='auto', logger=None, program=None, project=None):
-    """Upload file to GDC with environment-appropriate progress display."""
-    if program and project:
-        url = f"https://api.gdc.cancer.gov/v0/submission/{program}/{project}/files/{file_id}"
-    else:
-        url = f"https://api.gdc.cancer.gov/v0/submission/files/{file_id}"
-    
-    file_size = file_path.stat().st_size
+def _start_precheck(url, headers):
+    """Run check_file_exists on a daemon thread and return its future.
+
+    A daemon thread (rather than an executor worker, which the interpreter
+    joins at exit) lets the CLI exit as soon as the upload is done even if
+    the check is still waiting on GDC.
+    """
+    future = Future()
     
-    headers = {
-        'x-auth-token': token
-    }
+    def run():
+        future.set_result(check_file_exists(url, None, headers=headers))
     
-    # Log request details for debugging
-    if logger:
-        logger.echo(f"Upload URL: {url}")
-        logger.echo(f"File size: {file_size} bytes ({file_size / (1024**3):.2f} GB)")
-        logger.echo(f"Token (first 10 chars): {token[:10]}...")
-        
-        # Log the equivalent curl command
-        logger.echo("")
-        logger.echo("Equivalent curl command:")
-        logger.echo(f'curl --header "x-auth-token: $token" --request PUT -T "{file_path}" "{url}"')
-        logger.echo("")
+    threading.Thread(target=run, name="gdc-precheck", daemon=True).start()
+    return future
+
+
+def _report_precheck(future, logger=None):
+    """Wait briefly for the existence check and log its outcome."""
+    try:
+        exists, message = future.result(timeout=_PRECHECK_TIMEOUT)
+    except FutureTimeoutError:
+        if logger:
+            logger.echo("File status: existence check timed out, starting upload")
+        return
     
-    # Check if file already exists
-    exists, message = check_file_exists(url, token, logger)
+    if not logger:
+        return
     if exists:
-        if logger:
-            logger.echo(f"⚠️  Warning: {message}")
-            logger.echo("File may have already been uploaded. Attempting upload anyway...")
-    elif exists is False and logger:
+        logger.echo(f"⚠️  Warning: {message}")
+        logger.echo("File may have already been uploaded. Attempting upload anyway...")
+    elif exists is False:
         logger.echo(f"File status: {message}")
-    
-    # Use curl for upload since it works where requests fails
+    else:
+        logger.echo(f"Warning: Could not check file existence: {message}")
+
+
+class _UploadBody:
+    """Iterable request body that reports its length.
+
+    requests sends a plain Content-Length upload (like ``curl -T``) for
+    iterables that define ``__len__`` instead of falling back to chunked
+    transfer encoding.
+    """
+
+    __slots__ = ('_chunks', '_size')
+
+    def __init__(self, chunks, size):
+        self._chunks = chunks
+        self._size = size
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+    def __len__(self):
+        return self._size
+
+
+def _upload_body(chunks, size):
+    """Wrap ``chunks`` as a request body of ``size`` bytes.
+
+    requests only sets Content-Length for bodies with a non-zero length, so
+    an empty file is sent as ``b''`` to get ``Content-Length: 0`` (as curl
+    does) rather than a chunked PUT.
+    """
+    if size == 0:
+        return b''
+    return _UploadBody(chunks, size)
+
+
+def _build_upload_url(file_id, program=None, project=None):
+    """Build the GDC submission URL for a file."""
+    if program and project:
+        return f"{_GDC_SUBMISSION_URL}/{program}/{project}/files/{file_id}"
+    return f"{_GDC_SUBMISSION_URL}/files/{file_id}"
+
+
+def _pick_chunk_size(file_size):
+    """Scale the read size with the file, between 1 MiB and 8 MiB."""
+    return min(_MAX_CHUNK_SIZE, max(_MIN_CHUNK_SIZE, file_size // 1024))
+
+
+def _parse_upload_response(output):
+    """Parse the GDC response body, tolerating empty or non-JSON output."""
+    output = output.strip()
+    try:
+        if output:
+            return json.loads(output)
+        else:
+            return {"status": "success"}
+    except json.JSONDecodeError:
+        return {"status": "success", "response": output}
+
+
+def _advise_sequential(f, offset=0, length=0):
+    """Hint the kernel to read ahead aggressively on an upload file.
+
+    A no-op where posix_fadvise is unavailable (macOS, Windows).
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), offset, length, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _upload_with_requests(file_path, url, headers, file_size, chunk_size, progress_mode, logger):
+    """Stream the file to GDC in-process with requests."""
+    progress = get_progress_handler(file_size, "Uploading", mode=progress_mode, logger=logger)
+
+    with open(file_path, 'rb') as f:
+        _advise_sequential(f)
+        if progress is None:
+            body = _upload_body(chunk_reader(f, chunk_size, reuse_buffer=True), file_size)
+            response = _SESSION.put(url, headers=headers, data=body, timeout=_HTTP_TIMEOUT)
+        else:
+            with progress as pbar:
+                body = _upload_body(chunk_reader(f, chunk_size, pbar.update, reuse_buffer=True), file_size)
+                response = _SESSION.put(url, headers=headers, data=body, timeout=_HTTP_TIMEOUT)
+
+    response.raise_for_status()
+
+    if logger:
+        logger.echo("✓ Upload completed successfully")
+
+    try:
+        return response.json()
+    except ValueError:
+        return _parse_upload_response(response.text)
+
+
+def _upload_with_curl(file_path, url, token, file_size, progress_mode, logger):
+    """Upload the file by shelling out to curl."""
     if logger:
         logger.echo("Using curl for upload...")
     
@@ -255,9 +451,6 @@ def upload_file_with_progress(file_path, file_id, token, chunk_size=8*1024*1024,
     show_progress = progress_mode != 'none'
     
     if show_progress:
-        # For non-TTY environments, use curl with custom progress parsing
-        import re
-        
         # Use curl's progress output that works in all environments
         curl_cmd.extend(['-#'])  # Simple progress bar
         
@@ -273,10 +466,7 @@ def upload_file_with_progress(file_path, file_id, token, chunk_size=8*1024*1024,
         # Initialize progress tracking
         progress = SimpleProgress(file_size, "Uploading", logger=logger)
         last_percent = -1
-        
-        # For files > 20GB, update every 0.25%, otherwise every 1.25%
-        twenty_gb = 20 * 1024 * 1024 * 1024
-        update_interval = 0.25 if file_size > twenty_gb else 1.25
+        update_interval = progress._update_interval
         
         with progress:
             # Read stderr (where curl sends progress)
@@ -286,11 +476,11 @@ def upload_file_with_progress(file_path, file_id, token, chunk_size=8*1024*1024,
                     break
                     
                 # Parse curl progress: ######################################################################## 100.0%
-                if '#' in line:
-                    # Count the number of # characters
-                    hash_count = line.count('#')
-                    # Each # represents roughly 1.25% (80 chars = 100%)
-                    percent = min(hash_count * 1.25, 100)
+                if '%' in line:
+                    match = _CURL_PCT_RE.search(line)
+                    if not match:
+                        continue
+                    percent = min(float(match.group(1)), 100)
                     
                     if percent >= last_percent + update_interval:
                         # Update progress based on percentage
@@ -311,49 +501,233 @@ def upload_file_with_progress(file_path, file_id, token, chunk_size=8*1024*1024,
             if logger:
                 logger.echo("✓ Upload completed successfully")
             
-            # Try to parse response as JSON
-            output = stdout.strip()
-            try:
-                if output:
-                    return json.loads(output)
-                else:
-                    return {"status": "success"}
-            except json.JSONDecodeError:
-                return {"status": "success", "response": output}
+            return _parse_upload_response(stdout)
     
     else:
-        # No progress display
+        # Run curl command without progress
+        result = subprocess.run(
+            curl_cmd,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        
+        if result.returncode != 0:
+            error_msg = result.stderr or "Unknown error"
+            raise Exception(f"Curl failed: {error_msg}")
+        
+        # Success
+        if logger:
+            logger.echo("✓ Upload completed successfully")
+        
+        return _parse_upload_response(result.stdout)
+
+
+def upload_file_with_progress(file_path, file_id, token, chunk_size=None, progress_mode='auto', logger=None, program=None, project=None, use_curl=False, file_size=None, precheck=True):
+    """Upload file to GDC with environment-appropriate progress display.
+
+    The file is streamed in-process with requests; pass ``use_curl=True`` to
+    fall back to a curl subprocess instead. ``file_size`` may be passed by
+    callers that have already stat'ed the file. When ``chunk_size`` is not
+    given it is picked from the file size (1-8 MiB).
+
+    Unless ``precheck`` is False, a check for an existing upload runs in the
+    background while the upload is prepared; it only ever produces a warning.
+    """
+    url = _build_upload_url(file_id, program, project)
+    headers = {
+        'x-auth-token': token
+    }
+    precheck_future = _start_precheck(url, headers) if precheck else None
+    
+    if file_size is None:
+        file_size = file_path.stat().st_size
+    if chunk_size is None:
+        chunk_size = _pick_chunk_size(file_size)
+    
+    # Log request details for debugging
+    if logger:
+        logger.echo(f"Upload URL: {url}")
+        logger.echo(f"File size: {file_size} bytes ({file_size / _GB:.2f} GB)")
+        logger.echo(f"Token (first 10 chars): {token[:10]}...")
+        
+        # Log the equivalent curl command
+        logger.echo("")
+        logger.echo("Equivalent curl command:")
+        logger.echo(f'curl --header "x-auth-token: $token" --request PUT -T "{file_path}" "{url}"')
+        logger.echo("")
+    
+    if precheck_future is not None:
+        _report_precheck(precheck_future, logger)
+    
+    if logger:
+        # Nothing may be logged for the length of the transfer (e.g. under a
+        # tqdm bar), so get the setup lines on disk now
+        logger.flush()
+    
+    try:
+        if use_curl:
+            return _upload_with_curl(file_path, url, token, file_size, progress_mode, logger)
+        return _upload_with_requests(file_path, url, headers, file_size, chunk_size, progress_mode, logger)
+    except Exception as e:
+        if logger:
+            logger.echo(f"Upload error: {e}", err=True)
+        raise
+
+
+def _read_range(file_path, offset, length, chunk_size, callback=None):
+    """Yield ``length`` bytes of ``file_path`` starting at ``offset``."""
+    with open(file_path, 'rb') as f:
+        _advise_sequential(f, offset, length)
+        f.seek(offset)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            if callback:
+                callback(len(chunk))
+            yield chunk
+
+
+def _xml_text(xml, tag):
+    """Return the text of the first element named ``tag`` (any namespace)."""
+    for element in ElementTree.fromstring(xml).iter():
+        if element.tag.rsplit('}', 1)[-1] == tag:
+            return element.text
+    return None
+
+
+def upload_file_multipart(file_path, file_id, token, part_size=64*1024*1024, concurrency=4, chunk_size=None, progress_mode='auto', logger=None, program=None, project=None, file_size=None, precheck=True):
+    """Upload file to GDC as a multipart upload with parallel part PUTs.
+
+    Uses the S3-style multipart protocol of the GDC submission API: the
+    upload is initiated with ``POST ?uploads``, up to ``concurrency`` parts of
+    ``part_size`` bytes are PUT at once, and the upload is completed with the
+    list of part ETags. On failure the multipart upload is aborted.
+
+    ``part_size`` is raised as needed to keep within the 10,000 part limit.
+    """
+    if part_size < _MIN_PART_SIZE:
+        raise ValueError(f"part_size must be at least {_MIN_PART_SIZE} bytes")
+    if not 1 <= concurrency <= _MAX_CONCURRENCY:
+        raise ValueError(f"concurrency must be between 1 and {_MAX_CONCURRENCY}")
+    
+    url = _build_upload_url(file_id, program, project)
+    headers = {
+        'x-auth-token': token
+    }
+    precheck_future = _start_precheck(url, headers) if precheck else None
+    
+    if file_size is None:
+        file_size = file_path.stat().st_size
+    if file_size > part_size * _MAX_PARTS:
+        # Grow the parts (to a whole MiB) rather than fail at part 10,001
+        part_size = math.ceil(file_size / _MAX_PARTS / _MB) * _MB
+    if chunk_size is None:
+        chunk_size = _pick_chunk_size(part_size)
+    
+    part_count = max(1, math.ceil(file_size / part_size))
+    
+    if logger:
+        logger.echo(f"Upload URL: {url}")
+        logger.echo(f"File size: {file_size} bytes ({file_size / _GB:.2f} GB)")
+        logger.echo(f"Multipart upload: {part_count} part(s) of up to {part_size / _MB:.0f} MB, {concurrency} at a time")
+    
+    if precheck_future is not None:
+        _report_precheck(precheck_future, logger)
+    
+    response = _SESSION.post(f"{url}?uploads", headers=headers, timeout=_HTTP_TIMEOUT)
+    response.raise_for_status()
+    upload_id = _xml_text(response.content, 'UploadId')
+    if not upload_id:
+        raise ValueError(f"No UploadId in multipart initiation response: {response.text}")
+    
+    if logger:
+        logger.flush()
+    
+    progress = get_progress_handler(file_size, "Uploading", mode=progress_mode, logger=logger)
+    progress_lock = threading.Lock()
+    failed = threading.Event()
+    
+    def upload_part(part_number, pbar):
+        # A worker can dequeue the next part before the failure reaches the
+        # main thread and the queue is cancelled. Skip it quietly so that the
+        # failed part's exception is the one raised.
+        if failed.is_set():
+            return None
         try:
-            # Run curl command without progress
-            result = subprocess.run(
-                curl_cmd,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode != 0:
-                error_msg = result.stderr or "Unknown error"
-                raise Exception(f"Curl failed: {error_msg}")
-            
-            # Success
-            if logger:
-                logger.echo("✓ Upload completed successfully")
-            
-            # Try to parse response as JSON
-            output = result.stdout.strip()
+            return _upload_part(part_number, pbar)
+        except BaseException:
+            failed.set()
+            raise
+    
+    def _upload_part(part_number, pbar):
+        offset = (part_number - 1) * part_size
+        length = min(part_size, file_size - offset)
+        
+        callback = None
+        if pbar is not None:
+            def callback(n):
+                with progress_lock:
+                    pbar.update(n)
+        
+        body = _upload_body(_read_range(file_path, offset, length, chunk_size, callback), length)
+        part_response = _SESSION.put(
+            f"{url}?partNumber={part_number}&uploadId={upload_id}",
+            headers=headers,
+            data=body,
+            timeout=_HTTP_TIMEOUT
+        )
+        part_response.raise_for_status()
+        return part_number, part_response.headers['ETag']
+    
+    def upload_parts(pbar):
+        with ThreadPoolExecutor(max_workers=min(concurrency, part_count)) as executor:
+            futures = [executor.submit(upload_part, n, pbar) for n in range(1, part_count + 1)]
             try:
-                if output:
-                    return json.loads(output)
-                else:
-                    return {"status": "success"}
-            except json.JSONDecodeError:
-                return {"status": "success", "response": output}
+                return sorted(future.result() for future in as_completed(futures))
+            except BaseException:
+                # Drop the queued parts; leaving the with-block still waits
+                # for the ones already in flight before the upload is aborted.
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    try:
+        if progress is None:
+            etags = upload_parts(None)
+        else:
+            with progress as pbar:
+                etags = upload_parts(pbar)
         
-        except Exception as e:
-            if logger:
-                logger.echo(f"Upload error: {e}", err=True)
-            raise
+        parts_xml = ''.join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in etags
+        )
+        response = _SESSION.post(
+            f"{url}?uploadId={upload_id}",
+            headers=headers,
+            data=f"<CompleteMultipartUpload>{parts_xml}</CompleteMultipartUpload>",
+            timeout=_HTTP_TIMEOUT
+        )
+        response.raise_for_status()
+    except BaseException as e:
+        # Abort on interrupts too, so no orphaned multipart upload is left on
+        # the server; the abort must not hang the failure path
+        if logger:
+            logger.echo(f"Upload error: {e}", err=True)
+        try:
+            _SESSION.delete(f"{url}?uploadId={upload_id}", headers=headers, timeout=_CHECK_HTTP_TIMEOUT)
+        except requests.exceptions.RequestException:
+            pass
+        raise
+    
+    if logger:
+        logger.echo("✓ Upload completed successfully")
+    
+    return _parse_upload_response(response.text)
 
 
 @click.command()
@@ -374,8 +748,19 @@ def upload_file_with_progress(file_path, file_id, token, chunk_size=8*1024*1024,
               help='Append to output file instead of overwriting')
 @click.option('--legacy-endpoint', is_flag=True,
               help='Use legacy endpoint without program/project in URL')
-def main(manifest, file, file_path, token, progress_mode, output, append, legacy_endpoint):
+@click.option('--chunk-size', type=click.IntRange(min=1),
+              help='Upload read size in bytes (default: 1-8 MiB based on file size)')
+@click.option('--skip-precheck', is_flag=True,
+              help='Do not check whether the file already exists in GDC before uploading')
+@click.option('--concurrency', type=click.IntRange(1, _MAX_CONCURRENCY), default=1,
+              help=f'Upload this many parts in parallel using multipart upload (1-{_MAX_CONCURRENCY}, default: 1, single PUT)')
+@click.option('--use-curl', is_flag=True,
+              help='Upload with a curl subprocess instead of the built-in HTTP client')
+def main(manifest, file, file_path, token, progress_mode, output, append, legacy_endpoint, chunk_size, skip_precheck, concurrency, use_curl):
     """Upload file to GDC with environment-aware progress monitoring."""
+    if use_curl and concurrency > 1:
+        raise click.UsageError("--use-curl cannot be combined with --concurrency")
+    
     with Logger(output, append) as logger:
         try:
             # Validate inputs
@@ -421,7 +806,8 @@ def main(manifest, file, file_path, token, progress_mode, output, append, legacy
             
             logger.echo(f"Found file: {actual_file_path}")
             logger.echo(f"File ID: {file_id}")
-            logger.echo(f"File size: {actual_file_path.stat().st_size:,} bytes")
+            file_size = actual_file_path.stat().st_size
+            logger.echo(f"File size: {file_size:,} bytes")
             
             # Validate token
             token_value = validate_token(token_path)
@@ -430,32 +816,43 @@ def main(manifest, file, file_path, token, progress_mode, output, append, legacy
             if legacy_endpoint or not (program and project):
                 if not legacy_endpoint:
                     logger.echo("Warning: No program/project found in manifest, using legacy endpoint")
-                upload_url = f"https://api.gdc.cancer.gov/v0/submission/files/{file_id}"
+                upload_url = _build_upload_url(file_id)
             else:
                 logger.echo(f"Program: {program}, Project: {project}")
-                upload_url = f"https://api.gdc.cancer.gov/v0/submission/{program}/{project}/files/{file_id}"
+                upload_url = _build_upload_url(file_id, program, project)
             
             # Upload with progress
             logger.echo("Starting upload...")
             
+            if concurrency > 1:
+                upload = partial(upload_file_multipart, concurrency=concurrency)
+            else:
+                upload = partial(upload_file_with_progress, use_curl=use_curl)
+            
             # Use legacy endpoint if requested or if program/project not found
             if legacy_endpoint or not (program and project):
-                result = upload_file_with_progress(
+                result = upload(
                     actual_file_path, 
                     file_id, 
                     token_value,
                     progress_mode=progress_mode,
-                    logger=logger
+                    logger=logger,
+                    file_size=file_size,
+                    chunk_size=chunk_size,
+                    precheck=not skip_precheck
                 )
             else:
-                result = upload_file_with_progress(
+                result = upload(
                     actual_file_path, 
                     file_id, 
                     token_value,
                     progress_mode=progress_mode,
                     logger=logger,
                     program=program,
-                    project=project
+                    project=project,
+                    file_size=file_size,
+                    chunk_size=chunk_size,
+                    precheck=not skip_precheck
                 )
             
             logger.echo(f"✓ Upload successful!")
@@ -4,7 +4,7 @@ Utility functions for GDC uploader.
 """
 
 from pathlib import Path
-from typing import Optional, Iterator
+from typing import Optional, Iterator, Union
 
 
 def find_file(filename: str, search_dirs: Optional[list] = None) -> Optional[Path]:
@@ -35,7 +35,8 @@ def find_file(filename: str, search_dirs: Optional[list] = None) -> Optional[Pat
     return None
 
 
-def chunk_reader(file_obj, chunk_size: int, callback=None) -> Iterator[bytes]:
+def chunk_reader(file_obj, chunk_size: int, callback=None,
+                 reuse_buffer: bool = False) -> Iterator[Union[bytes, memoryview]]:
     """
     Read file in chunks with optional callback.
     
@@ -43,10 +44,25 @@ def chunk_reader(file_obj, chunk_size: int, callback=None) -> Iterator[bytes]:
         file_obj: File object to read
         chunk_size: Size of chunks in bytes
         callback: Optional callback function called with chunk size
+        reuse_buffer: Read into a single preallocated buffer and yield
+            memoryview slices of it. Each chunk is only valid until the next
+            one is requested.
         
     Yields:
         Chunks of file data
     """
+    if reuse_buffer and hasattr(file_obj, 'readinto'):
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        while True:
+            n = file_obj.readinto(buf)
+            if not n:
+                break
+            if callback:
+                callback(n)
+            yield view[:n]
+        return
+    
     while True:
         chunk = file_obj.read(chunk_size)
         if not chunk:
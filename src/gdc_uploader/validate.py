@@ -8,6 +8,16 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def validate_manifest(manifest_path: Path) -> List[Dict[str, Any]]:
     """
@@ -29,11 +39,20 @@ def validate_manifest(manifest_path: Path) -> List[Dict[str, Any]]:
     suffix = manifest_path.suffix.lower()
     
     try:
-        with open(manifest_path) as f:
-            if suffix in ['.yaml', '.yml']:
-                data = yaml.safe_load(f)
-            else:
-                # Default to JSON for .json or unknown extensions
+        if suffix in ['.yaml', '.yml']:
+            with open(manifest_path) as f:
+                data = yaml.load(f, Loader=_YamlLoader)
+        elif orjson is not None:
+            try:
+                data = orjson.loads(manifest_path.read_bytes())
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json (no NaN/Infinity, UTF-8 only);
+                # let the standard parser decide so both accept the same files
+                with open(manifest_path) as f:
+                    data = json.load(f)
+        else:
+            # Default to JSON for .json or unknown extensions
+            with open(manifest_path) as f:
                 data = json.load(f)
     except (json.JSONDecodeError, yaml.YAMLError) as e:
         raise ValueError(f"Invalid {suffix[1:].upper() if suffix else 'JSON'} in manifest: {e}")
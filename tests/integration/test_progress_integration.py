@@ -61,7 +61,7 @@ class TestProgressIntegration:
             mock_pbar.update = track_progress
             mock_tqdm.return_value.__enter__.return_value = mock_pbar
             
-            with patch('gdc_uploader.upload.requests.put', side_effect=mock_put_with_delay):
+            with patch('gdc_uploader.upload._SESSION.put', side_effect=mock_put_with_delay):
                 result = upload_file_with_progress(
                     test_file,
                     "test-id",
@@ -100,7 +100,7 @@ class TestProgressIntegration:
                 mock_pbar.update = lambda n: progress_updates.append(n)
                 mock_tqdm.return_value.__enter__.return_value = mock_pbar
                 
-                with patch('gdc_uploader.upload.requests.put') as mock_put:
+                with patch('gdc_uploader.upload._SESSION.put') as mock_put:
                     mock_response = Mock()
                     mock_response.json.return_value = {"status": "success"}
                     mock_response.raise_for_status.return_value = None
@@ -168,7 +168,7 @@ class TestProgressIntegration:
             mock_pbar.update = lambda n: progress_history.append(('attempt1', n))
             mock_tqdm.return_value.__enter__.return_value = mock_pbar
             
-            with patch('gdc_uploader.upload.requests.put', side_effect=mock_put_with_failure):
+            with patch('gdc_uploader.upload._SESSION.put', side_effect=mock_put_with_failure):
                 with pytest.raises(requests.RequestException):
                     upload_file_with_progress(test_file, "test-id", "token")
         
@@ -186,7 +186,7 @@ class TestProgressIntegration:
             mock_pbar.update = lambda n: progress_history.append(('attempt2', n))
             mock_tqdm.return_value.__enter__.return_value = mock_pbar
             
-            with patch('gdc_uploader.upload.requests.put', side_effect=mock_put_with_failure):
+            with patch('gdc_uploader.upload._SESSION.put', side_effect=mock_put_with_failure):
                 result = upload_file_with_progress(test_file, "test-id", "token")
                 assert result["status"] == "success"
         
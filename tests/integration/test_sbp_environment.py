@@ -75,7 +75,7 @@ class TestSBPEnvironment:
         test_content = b"X" * 10000  # 10KB
         test_file.write_bytes(test_content)
         
-        with patch('gdc_uploader.upload.requests.put') as mock_put:
+        with patch('gdc_uploader.upload._SESSION.put') as mock_put:
             def mock_put_func(*args, **kwargs):
                 # Consume data to trigger progress
                 data_gen = kwargs.get('data')
@@ -124,7 +124,7 @@ class TestSBPEnvironment:
         output = StringIO()
         
         with patch('sys.stdout', output):
-            with patch('gdc_uploader.upload.requests.put') as mock_put:
+            with patch('gdc_uploader.upload._SESSION.put') as mock_put:
                 mock_response = Mock()
                 mock_response.json.return_value = {"status": "success"}
                 mock_response.raise_for_status.return_value = None
@@ -181,7 +181,7 @@ class TestCWLIntegration:
             try:
                 os.chdir(cwl_staging)
                 
-                with patch('gdc_uploader.upload.requests.put') as mock_put:
+                with patch('gdc_uploader.upload._SESSION.put') as mock_put:
                     mock_response = Mock()
                     mock_response.json.return_value = {"status": "success"}
                     mock_response.raise_for_status.return_value = None
@@ -59,6 +59,59 @@ class TestLogger:
         assert "Second message" in content
         assert content.count("GDC Upload Log") == 2  # Two headers
     
+    def test_logger_flush_policy(self, tmp_path):
+        """Test routine lines are buffered while errors are flushed at once."""
+        log_file = tmp_path / "test.log"
+        
+        with Logger(log_file) as logger:
+            logger.echo("Buffered message", to_console=False)
+            assert "Buffered message" not in log_file.read_text()
+            
+            logger.echo("Error message", err=True, to_console=False)
+            content = log_file.read_text()
+            assert "Buffered message" in content
+            assert "ERROR: Error message" in content
+        
+        assert "Log ended at" in log_file.read_text()
+    
+    def test_upload_flushes_log_before_transfer(self, tmp_path):
+        """Test setup lines reach the log file before the transfer starts."""
+        from gdc_uploader.upload import upload_file_with_progress
+        
+        log_file = tmp_path / "test.log"
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Test content")
+        seen = {}
+        
+        def fake_put(*args, **kwargs):
+            seen['log'] = log_file.read_text()
+            response = Mock()
+            response.json.return_value = {"status": "success"}
+            return response
+        
+        with Logger(log_file) as logger:
+            with patch('gdc_uploader.upload._SESSION.put', side_effect=fake_put):
+                upload_file_with_progress(
+                    test_file, "test-id", "test-token",
+                    progress_mode='none', logger=logger, precheck=False
+                )
+        
+        assert "Upload URL:" in seen['log']
+    
+    def test_logger_timestamp_cached_per_second(self):
+        """Test the timestamp string is reformatted only when the second changes."""
+        logger = Logger()
+        
+        with patch('gdc_uploader.upload.time.time', return_value=1000.2), \
+             patch('gdc_uploader.upload.time.strftime', return_value="ts-1") as mock_strftime:
+            assert logger._timestamp() == "ts-1"
+            assert logger._timestamp() == "ts-1"
+            assert mock_strftime.call_count == 1
+        
+        with patch('gdc_uploader.upload.time.time', return_value=1001.0), \
+             patch('gdc_uploader.upload.time.strftime', return_value="ts-2"):
+            assert logger._timestamp() == "ts-2"
+    
     def test_logger_no_console(self, capsys):
         """Test logger with console output disabled."""
         logger = Logger()
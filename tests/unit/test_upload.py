@@ -58,6 +58,22 @@ class TestSimpleProgress:
         captured = capsys.readouterr()
         assert "Testing: 100.00% (0.00/0.00 GB)" in captured.out
 
+    def test_simple_progress_byte_thresholds(self, capsys):
+        """Test that reports for files <= 20GB are spaced 1.25% apart."""
+        progress = SimpleProgress(10000, "Testing")
+
+        progress.update(20)  # 0.20% - first report is due at 0.25%
+        assert capsys.readouterr().out == ""
+
+        progress.update(5)  # 0.25%
+        assert "Testing: 0.25%" in capsys.readouterr().out
+
+        progress.update(124)  # 1.49% - next report is due at 1.50%
+        assert capsys.readouterr().out == ""
+
+        progress.update(1)  # 1.50%
+        assert "Testing: 1.50%" in capsys.readouterr().out
+
 
 class TestEnvironmentDetection:
     """Test environment detection."""
@@ -112,7 +128,7 @@ class TestUploadWithProgress:
         test_content = b"Test data" * 1000  # ~9KB
         test_file.write_bytes(test_content)
         
-        with patch('gdc_uploader.upload.requests.put') as mock_put:
+        with patch('gdc_uploader.upload._SESSION.put') as mock_put:
             def consume_data(*args, **kwargs):
                 # Consume the data generator
                 data_gen = kwargs.get('data')
@@ -146,7 +162,7 @@ class TestUploadWithProgress:
         test_file = tmp_path / "test.txt"
         test_file.write_text("Test content")
         
-        with patch('gdc_uploader.upload.requests.put') as mock_put:
+        with patch('gdc_uploader.upload._SESSION.put') as mock_put:
             mock_response = Mock()
             mock_response.json.return_value = {"status": "success"}
             mock_response.raise_for_status.return_value = None
@@ -163,6 +179,137 @@ class TestUploadWithProgress:
             # Should have no progress output
             assert "Uploading:" not in captured.out
             assert result["status"] == "success"
+    
+    def test_upload_empty_file_sends_content_length(self, tmp_path):
+        """Test an empty file is PUT with Content-Length: 0, not chunked."""
+        import requests
+        
+        test_file = tmp_path / "empty.txt"
+        test_file.write_bytes(b"")
+        sent = {}
+        
+        def fake_put(url, **kwargs):
+            sent.update(requests.Request('PUT', url, data=kwargs['data']).prepare().headers)
+            response = Mock()
+            response.json.return_value = {"status": "success"}
+            return response
+        
+        with patch('gdc_uploader.upload._SESSION.put', side_effect=fake_put):
+            result = upload_file_with_progress(
+                test_file, "test-id", "test-token",
+                progress_mode='simple', precheck=False
+            )
+        
+        assert result["status"] == "success"
+        assert sent.get('Content-Length') == '0'
+        assert 'Transfer-Encoding' not in sent
+    
+    def test_upload_skips_precheck(self, tmp_path):
+        """Test precheck=False uploads without the existence round-trip."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Test content")
+        
+        with patch('gdc_uploader.upload.check_file_exists') as mock_check, \
+             patch('gdc_uploader.upload._SESSION.put') as mock_put:
+            mock_put.return_value.json.return_value = {"status": "success"}
+            
+            result = upload_file_with_progress(
+                test_file, "test-id", "test-token",
+                progress_mode='none', precheck=False
+            )
+        
+        mock_check.assert_not_called()
+        assert result["status"] == "success"
+    
+    def test_precheck_reuses_upload_headers(self, tmp_path):
+        """Test the existence check is sent with the upload's headers."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Test content")
+        
+        with patch('gdc_uploader.upload._SESSION') as mock_session:
+            mock_session.head.return_value.status_code = 404
+            mock_session.put.return_value.json.return_value = {"status": "success"}
+            
+            upload_file_with_progress(
+                test_file, "test-id", "test-token", progress_mode='none'
+            )
+        
+        head_headers = mock_session.head.call_args.kwargs['headers']
+        assert head_headers == {'x-auth-token': 'test-token'}
+        assert head_headers is mock_session.put.call_args.kwargs['headers']
+        assert mock_session.put.call_args.kwargs['timeout'] == (60, None)
+        assert mock_session.head.call_args.kwargs['timeout'] == (10, 30)
+    
+    def test_slow_precheck_does_not_block_upload(self, tmp_path):
+        """Test the upload starts when the existence check times out."""
+        import threading
+        
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Test content")
+        release = threading.Event()
+        logger = Mock()
+        
+        def slow_check(url, token, headers=None):
+            release.wait(5)
+            return False, "File not found"
+        
+        try:
+            with patch('gdc_uploader.upload.check_file_exists', side_effect=slow_check), \
+                 patch('gdc_uploader.upload._PRECHECK_TIMEOUT', 0.01), \
+                 patch('gdc_uploader.upload._SESSION.put') as mock_put:
+                mock_put.return_value.json.return_value = {"status": "success"}
+                
+                result = upload_file_with_progress(
+                    test_file, "test-id", "test-token",
+                    progress_mode='none', logger=logger
+                )
+            
+            # The still-running check must not keep the interpreter alive
+            pending = [t for t in threading.enumerate() if t.name == "gdc-precheck"]
+            assert pending and all(t.daemon for t in pending)
+        finally:
+            release.set()
+        
+        assert result["status"] == "success"
+        messages = [c.args[0] for c in logger.echo.call_args_list]
+        assert any("existence check timed out" in m for m in messages)
+    
+    @pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise not available")
+    def test_upload_advises_sequential_reads(self, tmp_path):
+        """Test the upload file is opened with a sequential readahead hint."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Test content")
+        
+        with patch('gdc_uploader.upload.os.posix_fadvise') as mock_fadvise, \
+             patch('gdc_uploader.upload._SESSION.put') as mock_put:
+            mock_put.return_value.json.return_value = {"status": "success"}
+            
+            upload_file_with_progress(
+                test_file, "test-id", "test-token",
+                progress_mode='none', precheck=False
+            )
+        
+        mock_fadvise.assert_called_once()
+        assert mock_fadvise.call_args.args[1:] == (0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    def test_session_socket_options(self):
+        """Test the shared session sets TCP_NODELAY and SO_KEEPALIVE."""
+        import socket
+        from gdc_uploader.upload import _SESSION
+        
+        adapter = _SESSION.get_adapter("https://api.gdc.cancer.gov")
+        options = adapter.poolmanager.connection_pool_kw['socket_options']
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    
+    def test_adaptive_chunk_size(self):
+        """Test default chunk size scales with file size within 1-8 MiB."""
+        from gdc_uploader.upload import _pick_chunk_size
+        
+        mib = 1024 * 1024
+        assert _pick_chunk_size(100) == mib
+        assert _pick_chunk_size(4 * 1024 * mib) == 4 * mib
+        assert _pick_chunk_size(100 * 1024 * mib) == 8 * mib
 
 
 class TestCLI:
@@ -204,6 +351,112 @@ class TestCLI:
         finally:
             os.chdir(original_dir)
     
+    def test_cli_passes_file_size(self, tmp_path):
+        """Test CLI stats the file once and passes the size to the upload."""
+        manifest = [{"id": "test-123", "file_name": "test.txt"}]
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+        (tmp_path / "token.txt").write_text("test-token-abc123def456ghi789")
+        (tmp_path / "test.txt").write_text("Test content")
+
+        runner = CliRunner()
+
+        original_dir = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+
+            with patch('gdc_uploader.upload.upload_file_with_progress') as mock_upload:
+                mock_upload.return_value = {"status": "success"}
+
+                result = runner.invoke(main, [
+                    '--manifest', 'manifest.json',
+                    '--file', 'test.txt',
+                    '--token', 'token.txt'
+                ])
+
+                assert result.exit_code == 0
+                assert mock_upload.call_args.kwargs['file_size'] == len("Test content")
+        finally:
+            os.chdir(original_dir)
+
+    def test_cli_use_curl(self, tmp_path):
+        """Test --use-curl selects the curl transport."""
+        manifest = [{"id": "test-123", "file_name": "test.txt"}]
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+        (tmp_path / "token.txt").write_text("test-token-abc123def456ghi789")
+        (tmp_path / "test.txt").write_text("Test content")
+
+        runner = CliRunner()
+
+        original_dir = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+
+            with patch('gdc_uploader.upload.upload_file_with_progress') as mock_upload:
+                mock_upload.return_value = {"status": "success"}
+
+                result = runner.invoke(main, [
+                    '--manifest', 'manifest.json',
+                    '--file', 'test.txt',
+                    '--token', 'token.txt',
+                    '--use-curl'
+                ])
+
+                assert result.exit_code == 0
+                assert mock_upload.call_args.kwargs['use_curl'] is True
+
+                result = runner.invoke(main, [
+                    '--manifest', 'manifest.json',
+                    '--file', 'test.txt',
+                    '--token', 'token.txt',
+                    '--use-curl',
+                    '--concurrency', '4'
+                ])
+
+                assert result.exit_code == 2
+                assert "--use-curl cannot be combined with --concurrency" in result.output
+        finally:
+            os.chdir(original_dir)
+
+    def test_cli_concurrency_uses_multipart(self, tmp_path):
+        """Test --concurrency > 1 uploads through the multipart path."""
+        manifest = [{"id": "test-123", "file_name": "test.txt"}]
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+        (tmp_path / "token.txt").write_text("test-token-abc123def456ghi789")
+        (tmp_path / "test.txt").write_text("Test content")
+
+        runner = CliRunner()
+
+        original_dir = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+
+            with patch('gdc_uploader.upload.upload_file_multipart') as mock_multipart, \
+                 patch('gdc_uploader.upload.upload_file_with_progress') as mock_upload:
+                mock_multipart.return_value = {"status": "success"}
+
+                result = runner.invoke(main, [
+                    '--manifest', 'manifest.json',
+                    '--file', 'test.txt',
+                    '--token', 'token.txt',
+                    '--concurrency', '4'
+                ])
+
+                assert result.exit_code == 0
+                mock_upload.assert_not_called()
+                assert mock_multipart.call_args.kwargs['concurrency'] == 4
+                assert mock_multipart.call_args.kwargs['file_size'] == len("Test content")
+
+                result = runner.invoke(main, [
+                    '--manifest', 'manifest.json',
+                    '--file', 'test.txt',
+                    '--token', 'token.txt',
+                    '--concurrency', '9'
+                ])
+
+                assert result.exit_code == 2
+        finally:
+            os.chdir(original_dir)
+
     def test_cli_with_output_file(self, tmp_path):
         """Test CLI with output file logging."""
         manifest = [{
@@ -267,4 +520,209 @@ class TestUtilityFunctions:
         
         assert len(callback_sizes) == 5
         assert sum(callback_sizes) == len(data)
-        assert b"".join(chunks) == data
\ No newline at end of file
+        assert b"".join(chunks) == data
+
+class TestMultipartUpload:
+    """Test multipart upload with parallel part PUTs."""
+    
+    @staticmethod
+    def _initiate_response():
+        response = Mock()
+        response.content = (
+            b'<InitiateMultipartUploadResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+            b'<UploadId>upload-1</UploadId></InitiateMultipartUploadResult>'
+        )
+        response.raise_for_status.return_value = None
+        return response
+    
+    def test_multipart_uploads_all_parts(self, tmp_path):
+        """Test each part is PUT with its byte range and the ETags are completed in order."""
+        from gdc_uploader.upload import upload_file_multipart, _MIN_PART_SIZE
+        
+        test_file = tmp_path / "test.bin"
+        data = os.urandom(2 * _MIN_PART_SIZE + 10)
+        test_file.write_bytes(data)
+        
+        received = {}
+        
+        def fake_put(url, headers=None, data=None, timeout=None):
+            part_number = int(url.split('partNumber=')[1].split('&')[0])
+            received[part_number] = b"".join(bytes(chunk) for chunk in data)
+            response = Mock()
+            response.headers = {'ETag': f'"etag-{part_number}"'}
+            response.raise_for_status.return_value = None
+            return response
+        
+        complete = Mock()
+        complete.text = ""
+        complete.raise_for_status.return_value = None
+        
+        with patch('gdc_uploader.upload._SESSION') as mock_session:
+            mock_session.post.side_effect = [self._initiate_response(), complete]
+            mock_session.put.side_effect = fake_put
+            
+            result = upload_file_multipart(
+                test_file, "test-id", "test-token",
+                part_size=_MIN_PART_SIZE, concurrency=3, progress_mode='none'
+            )
+        
+        assert result["status"] == "success"
+        assert sorted(received) == [1, 2, 3]
+        assert b"".join(received[n] for n in (1, 2, 3)) == data
+        
+        complete_call = mock_session.post.call_args_list[1]
+        assert complete_call.args[0].endswith("?uploadId=upload-1")
+        assert complete_call.kwargs['data'] == (
+            "<CompleteMultipartUpload>"
+            '<Part><PartNumber>1</PartNumber><ETag>"etag-1"</ETag></Part>'
+            '<Part><PartNumber>2</PartNumber><ETag>"etag-2"</ETag></Part>'
+            '<Part><PartNumber>3</PartNumber><ETag>"etag-3"</ETag></Part>'
+            "</CompleteMultipartUpload>"
+        )
+        mock_session.delete.assert_not_called()
+    
+    def test_multipart_aborts_on_failure(self, tmp_path):
+        """Test a failed part aborts the multipart upload."""
+        import requests
+        from gdc_uploader.upload import upload_file_multipart, _MIN_PART_SIZE
+        
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"X" * 100)
+        
+        with patch('gdc_uploader.upload._SESSION') as mock_session:
+            mock_session.post.return_value = self._initiate_response()
+            mock_session.put.side_effect = requests.ConnectionError("reset")
+            
+            with pytest.raises(requests.ConnectionError):
+                upload_file_multipart(
+                    test_file, "test-id", "test-token",
+                    part_size=_MIN_PART_SIZE, progress_mode='none'
+                )
+        
+        mock_session.delete.assert_called_once()
+        assert mock_session.delete.call_args.args[0].endswith("?uploadId=upload-1")
+    
+    def test_multipart_aborts_on_interrupt(self, tmp_path):
+        """Test Ctrl-C during a part still aborts the multipart upload."""
+        from gdc_uploader.upload import upload_file_multipart, _MIN_PART_SIZE
+        
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"X" * 100)
+        
+        with patch('gdc_uploader.upload._SESSION') as mock_session:
+            mock_session.post.return_value = self._initiate_response()
+            mock_session.put.side_effect = KeyboardInterrupt
+            
+            with pytest.raises(KeyboardInterrupt):
+                upload_file_multipart(
+                    test_file, "test-id", "test-token",
+                    part_size=_MIN_PART_SIZE, progress_mode='none', precheck=False
+                )
+        
+        mock_session.delete.assert_called_once()
+        assert mock_session.delete.call_args.kwargs['timeout'] == (10, 30)
+    
+    def test_multipart_cancels_queued_parts_on_failure(self, tmp_path):
+        """Test parts not yet started are skipped once a part fails."""
+        import requests
+        from gdc_uploader.upload import upload_file_multipart, _MIN_PART_SIZE
+        
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"X" * (5 * _MIN_PART_SIZE + 1))
+        
+        with patch('gdc_uploader.upload._SESSION') as mock_session:
+            mock_session.post.return_value = self._initiate_response()
+            mock_session.put.side_effect = requests.ConnectionError("reset")
+            
+            with pytest.raises(requests.ConnectionError):
+                upload_file_multipart(
+                    test_file, "test-id", "test-token",
+                    part_size=_MIN_PART_SIZE, concurrency=1, progress_mode='none'
+                )
+        
+        assert mock_session.put.call_count == 1
+        mock_session.delete.assert_called_once()
+    
+    def test_multipart_rejects_excess_concurrency(self, tmp_path):
+        """Test concurrency beyond the connection pool size is rejected."""
+        from gdc_uploader.upload import upload_file_multipart, _MAX_CONCURRENCY
+        
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"X" * 100)
+        
+        with pytest.raises(ValueError, match="concurrency"):
+            upload_file_multipart(
+                test_file, "test-id", "test-token", concurrency=_MAX_CONCURRENCY + 1
+            )
+    
+    def test_multipart_empty_file_sends_content_length(self, tmp_path):
+        """Test an empty file is uploaded as one Content-Length: 0 part."""
+        import requests
+        from gdc_uploader.upload import upload_file_multipart
+        
+        test_file = tmp_path / "empty.bin"
+        test_file.write_bytes(b"")
+        sent = []
+        
+        def fake_put(url, headers=None, data=None, timeout=None):
+            sent.append(requests.Request('PUT', url, data=data).prepare().headers)
+            response = Mock()
+            response.headers = {'ETag': '"etag-1"'}
+            return response
+        
+        complete = Mock()
+        complete.text = ""
+        
+        with patch('gdc_uploader.upload._SESSION') as mock_session:
+            mock_session.post.side_effect = [self._initiate_response(), complete]
+            mock_session.put.side_effect = fake_put
+            
+            upload_file_multipart(
+                test_file, "test-id", "test-token",
+                progress_mode='none', precheck=False
+            )
+        
+        assert len(sent) == 1
+        assert sent[0].get('Content-Length') == '0'
+        assert 'Transfer-Encoding' not in sent[0]
+    
+    def test_multipart_grows_parts_to_fit_part_limit(self, tmp_path):
+        """Test files beyond 10,000 parts get larger parts up front."""
+        from gdc_uploader.upload import upload_file_multipart, _MIN_PART_SIZE, _MB
+        
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"X" * 100)
+        file_size = 10000 * _MIN_PART_SIZE + 1  # one byte over the limit
+        part_numbers = []
+        
+        def fake_put(url, headers=None, data=None, timeout=None):
+            part_numbers.append(int(url.split('partNumber=')[1].split('&')[0]))
+            raise RuntimeError("stop after sizing")
+        
+        with patch('gdc_uploader.upload._SESSION') as mock_session:
+            mock_session.post.return_value = self._initiate_response()
+            mock_session.put.side_effect = fake_put
+            logger = Mock()
+            
+            with pytest.raises(RuntimeError):
+                upload_file_multipart(
+                    test_file, "test-id", "test-token",
+                    part_size=_MIN_PART_SIZE, concurrency=1,
+                    progress_mode='none', logger=logger,
+                    file_size=file_size, precheck=False
+                )
+        
+        messages = [c.args[0] for c in logger.echo.call_args_list]
+        # 5 MiB parts would need 10,001; 6 MiB parts need 8,334
+        assert any("8334 part(s) of up to 6 MB" in m for m in messages)
+        assert part_numbers == [1]
+    
+    def test_multipart_rejects_small_parts(self, tmp_path):
+        """Test part sizes below the S3 minimum are rejected."""
+        from gdc_uploader.upload import upload_file_multipart
+        
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"X" * 100)
+        
+        with pytest.raises(ValueError, match="part_size"):
+            upload_file_multipart(test_file, "test-id", "test-token", part_size=1024)
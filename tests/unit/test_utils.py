@@ -79,6 +79,25 @@ def test_chunk_reader_with_callback():
     assert len(chunks) == 3
 
 
+def test_chunk_reader_reuse_buffer():
+    """Test chunk reader yielding views over a single reused buffer."""
+    from io import BytesIO
+    
+    data = b"Hello, World! This is test data."
+    file_obj = BytesIO(data)
+    
+    sizes = []
+    received = b""
+    for chunk in chunk_reader(file_obj, chunk_size=5, callback=sizes.append,
+                              reuse_buffer=True):
+        assert isinstance(chunk, memoryview)
+        received += bytes(chunk)
+    
+    assert received == data
+    assert sizes[-1] == 2
+    assert sum(sizes) == len(data)
+
+
 def test_format_size():
     """Test size formatting."""
     assert format_size(0) == "0.0 B"
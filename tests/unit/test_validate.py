@@ -3,7 +3,9 @@
 
 import json
 import pytest
+from contextlib import nullcontext
 from pathlib import Path
+from unittest.mock import patch
 from gdc_uploader.validate import validate_manifest, validate_token, find_manifest_entry
 
 
@@ -52,6 +54,29 @@ def test_validate_manifest_invalid_json(tmp_path):
         validate_manifest(manifest_path)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_validate_manifest_json_parsers(tmp_path, use_orjson):
+    """Test the orjson and json parsers accept the same manifests."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+        parser = nullcontext()
+    else:
+        parser = patch('gdc_uploader.validate.orjson', None)
+    
+    manifest_path = tmp_path / "manifest.json"
+    invalid_path = tmp_path / "invalid.json"
+    manifest_path.write_text('[{"id": "abc123", "file_name": "sample1.fastq.gz", "score": NaN}]')
+    invalid_path.write_text("{invalid json")
+    
+    with parser:
+        entries = validate_manifest(manifest_path)
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            validate_manifest(invalid_path)
+    
+    assert entries[0]["id"] == "abc123"
+    assert entries[0]["score"] != entries[0]["score"]  # NaN
+
+
 def test_validate_token(tmp_path):
     """Test token validation."""
     token_path = tmp_path / "token.txt"